@@ -22,9 +22,14 @@ import warnings
 warnings.filterwarnings("ignore")
 
 import csv
+import itertools
+import json
 import re
+import sys
 import unicodedata
 import wave
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
@@ -32,6 +37,59 @@ from cog import BasePredictor, Input, Path as CogPath
 from piper import PiperVoice
 
 
+# Patterns and tables are immutable, so they are compiled once at import and
+# shared by every VietnameseTextProcessor instance.
+
+# Emoji deletion table: str.translate drops these code points in a
+# single pass without going through the regex engine
+_EMOJI_DELETE_TABLE = dict.fromkeys(itertools.chain(
+    range(0x1F600, 0x1F650), range(0x1F300, 0x1F600), range(0x1F680, 0x1F700),
+    range(0x1F1E0, 0x1F200), range(0x2600, 0x2700), range(0x2700, 0x27C0),
+    range(0x1F900, 0x1FA00), range(0x1F018, 0x1F271), range(0x238C, 0x2455),
+    range(0x20D0, 0x2100), [0xFE0F, 0x200D],
+))
+
+# Special character cleanup for TTS, fused into one alternation:
+# drop brackets/quotes, " —" -> ".", word_word -> word word, and
+# dashes -> space except between numbers
+_CLEAN_PATTERN = re.compile(
+    r'(?P<drop>[\\()¯"""])|(?P<emdash>\s—)|(?P<underscore>\b_\b)|(?P<dash>(?<!\d)-(?!\d))'
+)
+_CLEAN_REPLACEMENTS = {'drop': '', 'emdash': '.', 'underscore': ' ', 'dash': ' '}
+
+# Runs of characters kept by clean_text_for_tts
+_ALLOWED_CHARS_PATTERN = re.compile(r'[\u0000-\u024F\u1E00-\u1EFF]+')
+
+# Common number patterns
+_THOUSAND_SEP_PATTERN = re.compile(r'(\d{1,3}(?:\.\d{3})+)(?=\s|$|[^\d.,])')
+_DECIMAL_PATTERN = re.compile(r'(\d+),(\d+)(?=\s|$|[^\d,])')
+_PERCENTAGE_DECIMAL_PATTERN = re.compile(r'(\d+),(\d+)\s*%')
+_PERCENTAGE_PATTERN = re.compile(r'(\d+)\s*%')
+_STANDALONE_NUMBER_PATTERN = re.compile(r'\b\d+\b')
+_DIGIT_PROBE = re.compile(r'\d')
+
+# Sentence boundaries used to pipeline normalization with synthesis
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+# Time patterns
+_TIME_HMS_PATTERN = re.compile(r'(\d{1,2}):(\d{2})(?::(\d{2}))?')
+_TIME_HHMM_PATTERN = re.compile(r'(\d{1,2})h(\d{2})(?![a-zà-ỹ])', re.IGNORECASE)
+_TIME_H_PATTERN = re.compile(r'(\d{1,2})h(?![a-zà-ỹ\d])', re.IGNORECASE)
+_TIME_GIOPHUT_PATTERN = re.compile(r'(\d+)\s*giờ\s*(\d+)\s*phút')
+_TIME_GIO_PATTERN = re.compile(r'(\d+)\s*giờ(?!\s*\d)')
+
+# Date patterns
+_DATE_FULL_PATTERN = re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})')
+_DATE_MONTH_YEAR_PATTERN = re.compile(r'(?:tháng\s+)?(\d{1,2})\s*[/-]\s*(\d{4})')
+_DATE_DAY_MONTH_PATTERN = re.compile(r'(\d{1,2})\s*[/-]\s*(\d{1,2})(?![\/-]\d)')
+
+# Currency patterns
+_CURRENCY_VND_PATTERN1 = re.compile(r'(\d+(?:,\d+)?)\s*(?:đồng|VND|vnđ)\b', re.IGNORECASE)
+_CURRENCY_VND_PATTERN2 = re.compile(r'(\d+(?:,\d+)?)đ(?![a-zà-ỹ])', re.IGNORECASE)
+_CURRENCY_USD_PATTERN1 = re.compile(r'\$\s*(\d+(?:,\d+)?)')
+_CURRENCY_USD_PATTERN2 = re.compile(r'(\d+(?:,\d+)?)\s*(?:USD|\$)', re.IGNORECASE)
+
+
 class VietnameseTextProcessor:
     """Process Vietnamese text for TTS - ported from utils/vietnamese-processor.js"""
     
@@ -52,45 +110,37 @@ class VietnameseTextProcessor:
     }
     
     def __init__(self):
-        """Pre-compile regex patterns for performance."""
-        # Emoji pattern
-        self.emoji_pattern = re.compile(
-            r'[\U0001F600-\U0001F64F]|[\U0001F300-\U0001F5FF]|[\U0001F680-\U0001F6FF]|'
-            r'[\U0001F1E0-\U0001F1FF]|[\u2600-\u26FF]|[\u2700-\u27BF]|'
-            r'[\U0001F900-\U0001F9FF]|[\U0001F018-\U0001F270]|[\u238C-\u2454]|'
-            r'[\u20D0-\u20FF]|[\uFE0F]|[\u200D]',
-            flags=re.UNICODE
-        )
-        
-        # Pre-compile common patterns
-        self.thousand_sep_pattern = re.compile(r'(\d{1,3}(?:\.\d{3})+)(?=\s|$|[^\d.,])')
-        self.decimal_pattern = re.compile(r'(\d+),(\d+)(?=\s|$|[^\d,])')
-        self.percentage_decimal_pattern = re.compile(r'(\d+),(\d+)\s*%')
-        self.percentage_pattern = re.compile(r'(\d+)\s*%')
-        self.standalone_number_pattern = re.compile(r'\b\d+\b')
-        self.whitespace_pattern = re.compile(r'\s+')
-        
-        # Pre-compile time patterns
-        self.time_hms_pattern = re.compile(r'(\d{1,2}):(\d{2})(?::(\d{2}))?')
-        self.time_hhmm_pattern = re.compile(r'(\d{1,2})h(\d{2})(?![a-zà-ỹ])', re.IGNORECASE)
-        self.time_h_pattern = re.compile(r'(\d{1,2})h(?![a-zà-ỹ\d])', re.IGNORECASE)
-        self.time_giophut_pattern = re.compile(r'(\d+)\s*giờ\s*(\d+)\s*phút')
-        self.time_giờ_pattern = re.compile(r'(\d+)\s*giờ(?!\s*\d)')
-        
-        # Pre-compile date patterns
-        self.date_full_pattern = re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})')
-        self.date_month_year_pattern = re.compile(r'(?:tháng\s+)?(\d{1,2})\s*[/-]\s*(\d{4})')
-        self.date_day_month_pattern = re.compile(r'(\d{1,2})\s*[/-]\s*(\d{1,2})(?![\/-]\d)')
-        
-        # Pre-compile currency patterns
-        self.currency_vnd_pattern1 = re.compile(r'(\d+(?:,\d+)?)\s*(?:đồng|VND|vnđ)\b', re.IGNORECASE)
-        self.currency_vnd_pattern2 = re.compile(r'(\d+(?:,\d+)?)đ(?![a-zà-ỹ])', re.IGNORECASE)
-        self.currency_usd_pattern1 = re.compile(r'\$\s*(\d+(?:,\d+)?)')
-        self.currency_usd_pattern2 = re.compile(r'(\d+(?:,\d+)?)\s*(?:USD|\$)', re.IGNORECASE)
+        """Bind the shared pre-compiled patterns and tables."""
+        self._emoji_delete_table = _EMOJI_DELETE_TABLE
+        self._clean_pattern = _CLEAN_PATTERN
+        self._clean_replacements = _CLEAN_REPLACEMENTS
+        self._allowed_chars_pattern = _ALLOWED_CHARS_PATTERN
+        
+        self.thousand_sep_pattern = _THOUSAND_SEP_PATTERN
+        self.decimal_pattern = _DECIMAL_PATTERN
+        self.percentage_decimal_pattern = _PERCENTAGE_DECIMAL_PATTERN
+        self.percentage_pattern = _PERCENTAGE_PATTERN
+        self.standalone_number_pattern = _STANDALONE_NUMBER_PATTERN
+        self._digit_probe = _DIGIT_PROBE
+        
+        self.time_hms_pattern = _TIME_HMS_PATTERN
+        self.time_hhmm_pattern = _TIME_HHMM_PATTERN
+        self.time_h_pattern = _TIME_H_PATTERN
+        self.time_giophut_pattern = _TIME_GIOPHUT_PATTERN
+        self.time_giờ_pattern = _TIME_GIO_PATTERN
+        
+        self.date_full_pattern = _DATE_FULL_PATTERN
+        self.date_month_year_pattern = _DATE_MONTH_YEAR_PATTERN
+        self.date_day_month_pattern = _DATE_DAY_MONTH_PATTERN
+        
+        self.currency_vnd_pattern1 = _CURRENCY_VND_PATTERN1
+        self.currency_vnd_pattern2 = _CURRENCY_VND_PATTERN2
+        self.currency_usd_pattern1 = _CURRENCY_USD_PATTERN1
+        self.currency_usd_pattern2 = _CURRENCY_USD_PATTERN2
     
     def number_to_words(self, num_str: str) -> str:
         """Convert number string to Vietnamese words."""
-        num_str = re.sub(r'^0+', '', num_str) or '0'
+        num_str = num_str.lstrip('0') or '0'
         
         if num_str.startswith('-'):
             return 'âm ' + self.number_to_words(num_str[1:])
@@ -100,77 +150,9 @@ class VietnameseTextProcessor:
         except ValueError:
             return num_str
         
-        if num == 0:
-            return 'không'
-        if num < 10:
-            return self.DIGITS[str(num)]
-        if num < 20:
-            return self.TEENS[str(num)]
-        if num < 100:
-            tens = num // 10
-            units = num % 10
-            if units == 0:
-                return self.TENS[str(tens)]
-            elif units == 1:
-                return self.TENS[str(tens)] + ' mốt'
-            elif units == 4:
-                return self.TENS[str(tens)] + ' tư'
-            elif units == 5:
-                return self.TENS[str(tens)] + ' lăm'
-            else:
-                return self.TENS[str(tens)] + ' ' + self.DIGITS[str(units)]
         if num < 1000:
-            hundreds = num // 100
-            remainder = num % 100
-            result = self.DIGITS[str(hundreds)] + ' trăm'
-            if remainder == 0:
-                return result
-            elif remainder < 10:
-                return result + ' lẻ ' + self.DIGITS[str(remainder)]
-            else:
-                return result + ' ' + self.number_to_words(str(remainder))
-        if num < 1000000:
-            thousands = num // 1000
-            remainder = num % 1000
-            result = self.number_to_words(str(thousands)) + ' nghìn'
-            if remainder == 0:
-                return result
-            elif remainder < 100:
-                if remainder < 10:
-                    return result + ' không trăm lẻ ' + self.DIGITS[str(remainder)]
-                else:
-                    return result + ' không trăm ' + self.number_to_words(str(remainder))
-            else:
-                return result + ' ' + self.number_to_words(str(remainder))
-        if num < 1000000000:
-            millions = num // 1000000
-            remainder = num % 1000000
-            result = self.number_to_words(str(millions)) + ' triệu'
-            if remainder == 0:
-                return result
-            elif remainder < 100:
-                if remainder < 10:
-                    return result + ' không trăm lẻ ' + self.DIGITS[str(remainder)]
-                else:
-                    return result + ' không trăm ' + self.number_to_words(str(remainder))
-            else:
-                return result + ' ' + self.number_to_words(str(remainder))
-        if num < 1000000000000:
-            billions = num // 1000000000
-            remainder = num % 1000000000
-            result = self.number_to_words(str(billions)) + ' tỷ'
-            if remainder == 0:
-                return result
-            elif remainder < 100:
-                if remainder < 10:
-                    return result + ' không trăm lẻ ' + self.DIGITS[str(remainder)]
-                else:
-                    return result + ' không trăm ' + self.number_to_words(str(remainder))
-            else:
-                return result + ' ' + self.number_to_words(str(remainder))
-        
-        # For very large numbers, read digit by digit
-        return ' '.join(self.DIGITS.get(d, d) for d in num_str)
+            return _N2W_SMALL[num]
+        return _n2w_cached(num)
     
     def remove_thousand_separators(self, text: str) -> str:
         """Remove thousand separators (dots) from numbers."""
@@ -184,7 +166,7 @@ class VietnameseTextProcessor:
             integer_part = match.group(1)
             decimal_part = match.group(2)
             integer_words = self.number_to_words(integer_part)
-            decimal_words = self.number_to_words(re.sub(r'^0+', '', decimal_part) or '0')
+            decimal_words = self.number_to_words(decimal_part.lstrip('0') or '0')
             return f"{integer_words} phẩy {decimal_words}"
         return self.decimal_pattern.sub(replace, text)
     
@@ -195,7 +177,7 @@ class VietnameseTextProcessor:
             integer_part = match.group(1)
             decimal_part = match.group(2)
             integer_words = self.number_to_words(integer_part)
-            decimal_words = self.number_to_words(re.sub(r'^0+', '', decimal_part) or '0')
+            decimal_words = self.number_to_words(decimal_part.lstrip('0') or '0')
             return f"{integer_words} phẩy {decimal_words} phần trăm"
         text = self.percentage_decimal_pattern.sub(replace_decimal, text)
         
@@ -304,59 +286,161 @@ class VietnameseTextProcessor:
             return self.number_to_words(match.group(0))
         return self.standalone_number_pattern.sub(replace_standalone, text)
     
+    def _replace_clean(self, match) -> str:
+        return self._clean_replacements[match.lastgroup]
+    
+    def _filter_chars(self, text: str) -> str:
+        """Keep only Latin/Vietnamese characters (U+0000-U+024F, U+1E00-U+1EFF)."""
+        if text.isascii():
+            return text
+        # Collect runs of allowed characters rather than deleting one by one
+        return ''.join(self._allowed_chars_pattern.findall(text))
+    
     def clean_text_for_tts(self, text: str) -> str:
         """Clean text: remove emojis, special chars"""
         # Remove emojis
-        text = self.emoji_pattern.sub('', text)
+        text = text.translate(self._emoji_delete_table)
         
         # Remove special characters (combine multiple operations)
-        text = re.sub(r'[\\()¯"""]', '', text)  # Combined pattern
-        text = re.sub(r'\s—', '.', text)
-        text = re.sub(r'\b_\b', ' ', text)
-        # Remove dashes but preserve those between numbers
-        text = re.sub(r'(?<!\d)-(?!\d)', ' ', text)
+        text = self._clean_pattern.sub(self._replace_clean, text)
         # Keep only Latin, Vietnamese, numbers, punctuation, whitespace
-        text = re.sub(r'[^\u0000-\u024F\u1E00-\u1EFF]', '', text)
+        text = self._filter_chars(text)
         return text.strip()
     
     def process_vietnamese_text(self, text: str) -> str:
         """Main function to process Vietnamese text for TTS"""
         if not text:
             return ''
-        
+        return self.convert_cleaned_text(self.prepare_text(text))
+    
+    def prepare_text(self, text: str) -> str:
+        """Steps 1-2 of process_vietnamese_text: Unicode and TTS cleaning"""
         # Step 1: Normalize Unicode
         text = unicodedata.normalize('NFC', text)
         
         # Step 2: Clean text
-        text = self.clean_text_for_tts(text)
-        
-        # Step 3: Remove thousand separators
-        text = self.remove_thousand_separators(text)
-        
-        # Step 4: Convert dates
-        text = self.convert_date(text)
-        
-        # Step 5: Convert times
-        text = self.convert_time(text)
-        
-        # Step 6: Convert currency
-        text = self.convert_currency(text)
-        
-        # Step 7: Convert percentages
-        text = self.convert_percentage(text)
-        
-        # Step 8: Convert decimals
-        text = self.convert_decimal(text)
-        
-        # Step 9: Convert remaining standalone numbers
-        text = self.convert_standalone_numbers(text)
+        return self.clean_text_for_tts(text)
+    
+    def convert_cleaned_text(self, text: str) -> str:
+        """Steps 3-10 of process_vietnamese_text, for text from prepare_text"""
+        # Every number form needs a digit: skip steps 3-9 for plain text
+        if self._digit_probe.search(text):
+            # Step 3: Remove thousand separators
+            text = self.remove_thousand_separators(text)
+            
+            # Step 4: Convert dates
+            text = self.convert_date(text)
+            
+            # Step 5: Convert times
+            text = self.convert_time(text)
+            
+            # Step 6: Convert currency
+            text = self.convert_currency(text)
+            
+            # Step 7: Convert percentages
+            text = self.convert_percentage(text)
+            
+            # Step 8: Convert decimals
+            text = self.convert_decimal(text)
+            
+            # Step 9: Convert remaining standalone numbers
+            text = self.convert_standalone_numbers(text)
         
         # Step 10: Clean whitespace
-        text = self.whitespace_pattern.sub(' ', text).strip()
+        text = ' '.join(text.split())
         
         return text
 
 
+# Integer-indexed word tables so the conversion core never goes through str()
+_DIGITS = tuple(VietnameseTextProcessor.DIGITS[str(i)] for i in range(10))
+_TEENS = tuple(VietnameseTextProcessor.TEENS[str(i)] if i >= 10 else '' for i in range(20))
+_TENS = tuple(VietnameseTextProcessor.TENS.get(str(i), '') for i in range(10))
+# Digit-by-digit reading for very large numbers, done in one translate pass
+_DIGIT_TABLE = str.maketrans({d: w + ' ' for d, w in VietnameseTextProcessor.DIGITS.items()})
+
+
+def _n2w_below_thousand(num: int) -> str:
+    """Convert an integer in 0..999 to Vietnamese words."""
+    if num == 0:
+        return 'không'
+    if num < 10:
+        return _DIGITS[num]
+    if num < 20:
+        return _TEENS[num]
+    if num < 100:
+        tens = num // 10
+        units = num % 10
+        if units == 0:
+            return _TENS[tens]
+        elif units == 1:
+            return _TENS[tens] + ' mốt'
+        elif units == 4:
+            return _TENS[tens] + ' tư'
+        elif units == 5:
+            return _TENS[tens] + ' lăm'
+        else:
+            return _TENS[tens] + ' ' + _DIGITS[units]
+    hundreds = num // 100
+    remainder = num % 100
+    result = _DIGITS[hundreds] + ' trăm'
+    if remainder == 0:
+        return result
+    elif remainder < 10:
+        return result + ' lẻ ' + _DIGITS[remainder]
+    else:
+        return result + ' ' + _n2w_below_thousand(remainder)
+
+
+# Days, months, minutes and most counts are below 1000: read them straight
+# from a precomputed table
+_N2W_SMALL = tuple(_n2w_below_thousand(i) for i in range(1000))
+
+
+_SCALES = ((1000000000, 'tỷ'), (1000000, 'triệu'), (1000, 'nghìn'))
+
+
+@lru_cache(maxsize=4096)
+def _n2w_cached(num: int) -> str:
+    """Convert a non-negative integer to Vietnamese words (memoized).
+    
+    Numbers are read group by group (tỷ, triệu, nghìn, then the last three
+    digits) from the 0-999 table, without recursing into sub-numbers.
+    """
+    if num < 1000:
+        return _N2W_SMALL[num]
+    if num >= 1000000000000:
+        # For very large numbers, read digit by digit
+        return str(num).translate(_DIGIT_TABLE).rstrip()
+    
+    words = []
+    for divisor, scale in _SCALES:
+        if num < divisor:
+            continue
+        words.append(_N2W_SMALL[num // divisor] + ' ' + scale)
+        num %= divisor
+        if num == 0:
+            return ' '.join(words)
+        if num < 10:
+            words.append('không trăm lẻ ' + _DIGITS[num])
+            return ' '.join(words)
+        if num < 100:
+            words.append('không trăm ' + _N2W_SMALL[num])
+            return ' '.join(words)
+    words.append(_N2W_SMALL[num])
+    return ' '.join(words)
+
+
+# Normalization dictionaries, resolved against this file rather than the
+# working directory. The merged map and its trie pattern are cached next to
+# them as JSON so service boots skip CSV parsing and trie construction
+_PUBLIC_DIR = Path(__file__).resolve().parent / "public"
+_ACRONYMS_PATH = _PUBLIC_DIR / "acronyms.csv"
+_NON_VIETNAMESE_WORDS_PATH = _PUBLIC_DIR / "non-vietnamese-words.csv"
+_DICTIONARY_CACHE_PATH = _PUBLIC_DIR / ".dictionaries.json"
+_DICTIONARY_CACHE_VERSION = 2
+
+
 class Predictor(BasePredictor):
     """Vietnamese TTS predictor using Piper."""
 
@@ -371,91 +455,176 @@ class Predictor(BasePredictor):
         # Load voices (lazy loading)
         self.voices = {}
         
-        # Load normalization dictionaries
-        self.acronym_map = self._load_acronyms()
-        self.non_vietnamese_map = self._load_non_vietnamese_words()
+        # Load normalization dictionaries and model configs concurrently;
+        # they are independent and mostly I/O-bound on cold starts
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            model_configs = executor.submit(self._load_model_configs)
+            replacements, trie_pattern = self._load_dictionaries(executor)
+            self.model_configs = model_configs.result()
         
         # Pre-compile regex patterns for performance
-        self._compile_regex_patterns()
-        
-        # Cache model configs
-        self.model_configs = {}
-        for model_name, model_path in self.models.items():
-            config_path = Path(model_path).with_suffix('.onnx.json')
-            if config_path.exists():
-                import json
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    self.model_configs[model_name] = json.load(f)
+        self._compile_regex_patterns(replacements, trie_pattern)
         
         # Initialize Vietnamese text processor
         self.vn_processor = VietnameseTextProcessor()
+        
+        # Normalization is deterministic, so repeated phrases (intros,
+        # boilerplate) are served from an LRU cache bound to this instance
+        self._normalize_cached = lru_cache(maxsize=2048)(self._do_normalize)
+    
+    def _load_dictionaries(self, executor: ThreadPoolExecutor):
+        """Load the merged word/acronym map and its trie pattern.
+        
+        Served from the JSON cache when both CSVs are unchanged since it was
+        written; otherwise the CSVs are loaded with `executor` and the cache is
+        refreshed. Only the merged map is kept, so the per-file maps are not
+        held for the life of the service.
+        """
+        signature = []
+        for path in (_NON_VIETNAMESE_WORDS_PATH, _ACRONYMS_PATH):
+            try:
+                stat = path.stat()
+                signature.append([stat.st_mtime_ns, stat.st_size])
+            except OSError:
+                signature.append(None)
+        cache_key = [_DICTIONARY_CACHE_VERSION, signature]
+        
+        try:
+            with open(_DICTIONARY_CACHE_PATH, encoding="utf-8") as f:
+                cached_key, replacements, trie_pattern = json.load(f)
+            if cached_key == cache_key:
+                return {key: sys.intern(value) for key, value in replacements.items()}, trie_pattern
+        except Exception:
+            pass
+        
+        acronyms = executor.submit(self._load_acronyms)
+        non_vietnamese = executor.submit(self._load_non_vietnamese_words)
+        # Loader keys are already lowercase; acronyms win on duplicates
+        replacements = {**non_vietnamese.result(), **acronyms.result()}
+        trie_pattern = self._build_trie_pattern(replacements) if replacements else None
+        
+        # Write atomically so concurrent workers never read a partial file;
+        # a read-only checkout just skips caching
+        tmp_path = _DICTIONARY_CACHE_PATH.with_name(f"{_DICTIONARY_CACHE_PATH.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump([cache_key, replacements, trie_pattern], f, ensure_ascii=False)
+            os.replace(tmp_path, _DICTIONARY_CACHE_PATH)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        
+        return replacements, trie_pattern
     
-    def _compile_regex_patterns(self):
+    def _compile_regex_patterns(self, replacements: Dict[str, str], trie_pattern):
         """Pre-compile regex patterns for faster text normalization."""
-        # Create a single combined pattern for all replacements
-        # This is much faster than doing 100+ separate regex scans
-        all_patterns = []
-        replacements = {}
-        
-        # Add non-Vietnamese words
-        for word, pronunciation in self.non_vietnamese_map.items():
-            escaped_word = re.escape(word)
-            pattern_str = rf'\b{escaped_word}\b'
-            all_patterns.append(pattern_str)
-            replacements[word.lower()] = pronunciation
-        
-        # Add acronyms
-        for acronym, transliteration in self.acronym_map.items():
-            escaped_acronym = re.sub(r'[+?^${}()|[\]\\]', r'\\\g<0>', acronym)
-            pattern_str = rf'\b{escaped_acronym}\b'
-            all_patterns.append(pattern_str)
-            replacements[acronym.lower()] = transliteration
-        
-        # Combine all patterns into one regex (using alternation)
-        # Sort by length (longest first) to match longer patterns first
-        if all_patterns:
-            # Sort patterns by length descending to match longer ones first
-            sorted_patterns = sorted(all_patterns, key=len, reverse=True)
-            combined_pattern = '|'.join(f'({p})' for p in sorted_patterns)
-            self.combined_regex = re.compile(combined_pattern, re.IGNORECASE)
+        # All non-Vietnamese words and acronyms are merged into a prefix trie
+        # compiled as one regex: shared prefixes are matched once, so the
+        # scan cost no longer grows with the number of dictionary entries
+        if replacements:
+            # Keys and the text matched against are both lowercase, so the
+            # pattern needs no case folding
+            self.combined_regex = re.compile(rf'\b{trie_pattern}\b')
             self.replacements = replacements
         else:
             self.combined_regex = None
             self.replacements = {}
+        # Processor output is already whitespace-collapsed, so the dictionary
+        # pass only needs a cleanup if some value has irregular whitespace
+        self._values_need_collapse = any(
+            value != ' '.join(value.split()) for value in self.replacements.values()
+        )
+    
+    @staticmethod
+    def _build_trie_pattern(words) -> str:
+        """Build a regex matching any of `words`, factored as a prefix trie.
+        
+        Longer words are tried before their prefixes, so the longest entry that
+        satisfies the surrounding word boundaries wins.
+        """
+        trie = {}
+        for word in words:
+            node = trie
+            for ch in word:
+                node = node.setdefault(ch, {})
+            node[''] = {}
+        
+        def build(node) -> str:
+            branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+            if not branches:
+                return ''
+            if '' in node:
+                return '(?:' + '|'.join(branches) + ')?'
+            if len(branches) == 1:
+                return branches[0]
+            return '(?:' + '|'.join(branches) + ')'
+        
+        return f'(?:{build(trie)})'
+    
+    def _load_model_configs(self) -> Dict[str, dict]:
+        """Load the .onnx.json config of every available model."""
+        import json
+        model_configs = {}
+        for model_name, model_path in self.models.items():
+            config_path = Path(model_path).with_suffix('.onnx.json')
+            if config_path.exists():
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    model_configs[model_name] = json.load(f)
+        return model_configs
+    
+    @staticmethod
+    def _read_csv_columns(path: Path, key_column: str, value_column: str):
+        """Yield (key, value) pairs from two named CSV columns.
+        
+        Rows are read positionally, so no dict is built per row. Rows too short
+        to hold both columns are skipped.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if key_column not in header or value_column not in header:
+                return
+            key_index = header.index(key_column)
+            value_index = header.index(value_column)
+            min_length = max(key_index, value_index) + 1
+            for row in reader:
+                if len(row) >= min_length:
+                    yield row[key_index], row[value_index]
     
     def _load_acronyms(self) -> Dict[str, str]:
         """Load acronym mappings from CSV."""
         acronym_map = {}
-        acronyms_path = Path("public/acronyms.csv")
+        acronyms_path = _ACRONYMS_PATH
         
         if acronyms_path.exists():
-            with open(acronyms_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    acronym = row.get("acronym", "").strip().lower()
-                    transliteration = row.get("transliteration", "").strip()
-                    if acronym and transliteration:
-                        acronym_map[acronym] = transliteration
-        
-        # Sort by length (longest first) for proper matching priority
-        return dict(sorted(acronym_map.items(), key=lambda x: len(x[0]), reverse=True))
+            for acronym, transliteration in self._read_csv_columns(
+                acronyms_path, "acronym", "transliteration"
+            ):
+                acronym = acronym.strip().lower()
+                transliteration = transliteration.strip()
+                if acronym and transliteration:
+                    acronym_map[acronym] = sys.intern(transliteration)
+        
+        return acronym_map
     
     def _load_non_vietnamese_words(self) -> Dict[str, str]:
         """Load non-Vietnamese word mappings from CSV."""
         word_map = {}
-        words_path = Path("public/non-vietnamese-words.csv")
+        words_path = _NON_VIETNAMESE_WORDS_PATH
         
         if words_path.exists():
-            with open(words_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    word = row.get("word", "").strip().lower()
-                    pronunciation = row.get("vietnamese_pronunciation", "").strip()
-                    if word and pronunciation:
-                        word_map[word] = pronunciation
-        
-        # Sort by length (longest first) for proper matching priority
-        return dict(sorted(word_map.items(), key=lambda x: len(x[0]), reverse=True))
+            for word, pronunciation in self._read_csv_columns(
+                words_path, "word", "vietnamese_pronunciation"
+            ):
+                word = word.strip().lower()
+                pronunciation = pronunciation.strip()
+                if word and pronunciation:
+                    # Many pronunciations repeat: share one str object per value
+                    word_map[word] = sys.intern(pronunciation)
+        
+        return word_map
     
     def _normalize_text(self, text: str) -> str:
         """
@@ -467,10 +636,22 @@ class Predictor(BasePredictor):
         """
         if not text:
             return ''
-        
+        return self._normalize_cached(text, False)
+    
+    def _normalize_sentence(self, sentence: str) -> str:
+        """Like _normalize_text, for a sentence split from prepare_text output."""
+        if not sentence:
+            return ''
+        return self._normalize_cached(sentence, True)
+    
+    def _do_normalize(self, text: str, prepared: bool) -> str:
+        """Run the full normalization pipeline (uncached)."""
         # Step 1: Process Vietnamese text (numbers, dates, times, etc.)
-        # This also includes text cleaning
-        normalized = self.vn_processor.process_vietnamese_text(text)
+        # This also includes text cleaning unless it was already done
+        if prepared:
+            normalized = self.vn_processor.convert_cleaned_text(text)
+        else:
+            normalized = self.vn_processor.process_vietnamese_text(text)
         
         # Step 2: Normalize to lowercase for consistent matching
         mapping_input = normalized.lower()
@@ -478,20 +659,20 @@ class Predictor(BasePredictor):
         # Step 3 & 4: Replace all words/acronyms in a SINGLE pass using combined regex
         # This is MUCH faster than 100+ separate regex scans
         if self.combined_regex:
-            def replace_func(match):
-                matched = match.group(0).lower()
-                replacement = self.replacements.get(matched, matched)
-                # Preserve original case if first letter was uppercase
-                if match.group(0) and match.group(0)[0].isupper():
-                    return replacement[0].upper() + replacement[1:] if len(replacement) > 1 else replacement.upper()
-                return replacement
-            
-            mapping_input = self.combined_regex.sub(replace_func, mapping_input)
+            mapping_input = self.combined_regex.sub(self._replace_dictionary_match, mapping_input)
         
         # Clean up whitespace
-        normalized = re.sub(r'\s+', ' ', mapping_input).strip()
+        if self._values_need_collapse:
+            mapping_input = ' '.join(mapping_input.split())
         
-        return normalized
+        return mapping_input
+    
+    def _replace_dictionary_match(self, match) -> str:
+        """Replacement for a combined_regex match on the lowercased text."""
+        # Keys are stored lowercased and the input is already lowercase, so the
+        # matched text is looked up as is and no case needs restoring. The
+        # trie pattern only matches whole keys, so the lookup cannot miss
+        return self.replacements[match[0]]
     
     def _get_voice(self, model_name: str) -> PiperVoice:
         """Get or load voice model."""
@@ -507,6 +688,21 @@ class Predictor(BasePredictor):
         
         return self.voices[model_name]
     
+    @staticmethod
+    def _write_audio(wav_file, voice: PiperVoice, texts) -> None:
+        """Synthesize each text in order and append its audio to `wav_file`."""
+        wav_format_set = False
+        for text in texts:
+            if not text:
+                continue
+            for audio_chunk in voice.synthesize(text):
+                if not wav_format_set:
+                    wav_file.setframerate(audio_chunk.sample_rate)
+                    wav_file.setsampwidth(audio_chunk.sample_width)
+                    wav_file.setnchannels(audio_chunk.sample_channels)
+                    wav_format_set = True
+                wav_file.writeframes(audio_chunk.audio_int16_bytes)
+    
     def predict(
         self,
         text: str = Input(description="Text to synthesize (Vietnamese)"),
@@ -535,13 +731,6 @@ class Predictor(BasePredictor):
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
         
-        # Normalize text using comprehensive pipeline (or skip if disabled)
-        if enable_preprocessing:
-            normalized_text = self._normalize_text(text)
-        else:
-            # Skip preprocessing - use text as-is (faster)
-            normalized_text = text.strip()
-        
         # Get voice model
         voice = self._get_voice(model)
         
@@ -556,7 +745,22 @@ class Predictor(BasePredictor):
             # Synthesize to WAV file
             # Piper will handle phonemization internally using the voice from config
             with wave.open(wav_path, "wb") as wav_file:
-                voice.synthesize_wav(normalized_text, wav_file)
+                if enable_preprocessing:
+                    # Normalize sentence by sentence on a worker thread so that
+                    # sentence N+1 is prepared while ONNX inference (which
+                    # releases the GIL) runs on sentence N. Cleaning runs on
+                    # the whole text first: its rules look at the whitespace
+                    # the split would remove
+                    cleaned = self.vn_processor.prepare_text(text)
+                    sentences = _SENTENCE_BOUNDARY.split(cleaned)
+                    with ThreadPoolExecutor(max_workers=1) as executor:
+                        pending = [executor.submit(self._normalize_sentence, s) for s in sentences]
+                        self._write_audio(
+                            wav_file, voice, (future.result() for future in pending)
+                        )
+                else:
+                    # Skip preprocessing - use text as-is (faster)
+                    self._write_audio(wav_file, voice, [text.strip()])
             
             return CogPath(wav_path)
         except Exception as e:
@@ -3,7 +3,14 @@
 Simple test script for Vietnamese Normalizer library.
 """
 
-from vietnormalizer import VietnameseNormalizer
+from vietnormalizer import VietnameseNormalizer, VietnameseTextProcessor
+
+
+class _UpperProcessor(VietnameseTextProcessor):
+    """Subclass used to check that process_batch() workers keep the class."""
+
+    def process_vietnamese_text(self, text):
+        return super().process_vietnamese_text(text).upper()
 
 def main():
     """Test the Vietnamese normalizer."""
@@ -29,6 +36,37 @@ def main():
         print(f"  Input:    {text}")
         print(f"  Output:   {normalized}")
         print()
+    
+    # Dictionary words are looked up on \w runs, so a word next to a
+    # combining mark (İ lowercases to i + U+0307) or a symbol is still replaced
+    for options in ({}, {"enable_transliteration": False}):
+        assert normalizer.normalize("İGOOGLE test", **options) == "i\u0307gu-gồ tét"
+        assert normalizer.normalize("google× test", **options) == "gu-gồ× tét"
+    print("dictionary words next to marks and symbols: replaced")
+    
+    # normalize_many() must give the same output as normalize() on each text
+    batch = normalizer.normalize_many(test_cases)
+    assert batch == [normalizer.normalize(text) for text in test_cases]
+    batch = normalizer.normalize_many(test_cases, enable_transliteration=False)
+    assert batch == [normalizer.normalize(text, enable_transliteration=False) for text in test_cases]
+    print("normalize_many: matches normalize()")
+    
+    # process_batch() must match process_vietnamese_text(), including when
+    # the batch is larger than chunksize and goes through the worker pool
+    processor = VietnameseTextProcessor()
+    texts = test_cases * 10
+    expected = [processor.process_vietnamese_text(text) for text in texts]
+    assert processor.process_batch(texts, workers=1) == expected
+    assert processor.process_batch(texts, workers=2, chunksize=8) == expected
+    upper = _UpperProcessor()
+    assert upper.process_batch(texts, workers=2, chunksize=8) == [t.upper() for t in expected]
+    try:
+        processor.process_batch(texts, chunksize=0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("chunksize=0 should be rejected")
+    print("process_batch: matches process_vietnamese_text()")
 
 if __name__ == "__main__":
     main()
@@ -5,42 +5,58 @@ Ported from nghitts/src/utils/vietnamese-detector.js
 Uses diacritics, character patterns, and word structure analysis.
 """
 
-import re
+from functools import lru_cache
+
+VN_ACCENT_SET = frozenset('àáảãạăằắẳẵặâầấẩẫậèéẻẽẹêềếểễệìíỉĩịòóỏõọôồốổỗộơờớởỡợùúủũụưừứửữựỳýỷỹỵđ')
+EN_SPECIAL_CHARS = frozenset('fwzj')
+_INVALID_VOWEL_PAIRS = ('ee', 'oo', 'ea', 'ae', 'ie')
 
 
 class VnLanguageDetector:
     """Detect if a word is Vietnamese based on structure and character analysis."""
 
     def __init__(self):
-        self.vn_accent_regex = re.compile(
-            r'[àáảãạăằắẳẵặâầấẩẫậèéẻẽẹêềếểễệìíỉĩịòóỏõọôồốổỗộơờớởỡợùúủũụưừứửữựỳýỷỹỵđ]',
-            re.IGNORECASE
-        )
         self.vn_vowels = "ueoaiy"
         self.vn_onsets = {
             'b', 'c', 'd', 'đ', 'g', 'h', 'k', 'l', 'm', 'n', 'p', 'q', 'r', 's', 't', 'v', 'x',
             'ch', 'gh', 'gi', 'kh', 'ng', 'nh', 'ph', 'qu', 'th', 'tr'
         }
         self.vn_endings = {'p', 't', 'c', 'm', 'n', 'ng', 'ch', 'nh'}
-        self.en_special_chars = re.compile(r'[fwzj]', re.IGNORECASE)
-        self.syllable_regex = re.compile(r'^([^ueoaiy]*)([ueoaiy]+)([^ueoaiy]*)$')
+
+    def _split_syllable(self, w: str):
+        """Split `w` into (onset, vowel, ending) around its single vowel run.
+
+        Returns None when `w` has no vowel or more than one vowel run.
+        """
+        vowels = self.vn_vowels
+        first = last = -1
+        for i, ch in enumerate(w):
+            if ch in vowels:
+                if first < 0:
+                    first = i
+                elif last != i - 1:
+                    return None
+                last = i
+        if first < 0:
+            return None
+        return w[:first], w[first:last + 1], w[last + 1:]
 
     def is_vietnamese_word(self, word: str) -> bool:
         if not word:
             return False
         w = word.lower().strip()
 
-        if self.vn_accent_regex.search(w):
+        if not VN_ACCENT_SET.isdisjoint(w):
             return True
 
-        if self.en_special_chars.search(w):
+        if not EN_SPECIAL_CHARS.isdisjoint(w):
             return False
 
-        match = self.syllable_regex.match(w)
-        if not match:
+        parts = self._split_syllable(w)
+        if parts is None:
             return False
 
-        onset, vowel, ending = match.group(1), match.group(2), match.group(3)
+        onset, vowel, ending = parts
 
         if onset and onset not in self.vn_onsets:
             return False
@@ -48,7 +64,7 @@ class VnLanguageDetector:
         if ending and ending not in self.vn_endings:
             return False
 
-        if re.search(r'ee|oo|ea|ae|ie', vowel):
+        if any(pair in vowel for pair in _INVALID_VOWEL_PAIRS):
             if vowel not in ('oa', 'oe', 'ua', 'uy'):
                 return False
 
@@ -58,6 +74,7 @@ class VnLanguageDetector:
 _detector = VnLanguageDetector()
 
 
+@lru_cache(maxsize=131072)
 def is_vietnamese_word(word: str) -> bool:
-    """Check if a word is Vietnamese."""
+    """Check if a word is Vietnamese (memoized: detection depends only on the word)."""
     return _detector.is_vietnamese_word(word)
@@ -7,18 +7,38 @@ rule-based transliteration for words not found in dictionaries.
 """
 
 import csv
+import hashlib
+import json
+import os
 import re
+import sys
+import unicodedata
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional
 
 from .processor import VietnameseTextProcessor
 from .detector import is_vietnamese_word
 from .transliterator import transliterate_word
 
+# Words looked up in the CSV replacement map (the \w runs of the text)
+_DICTIONARY_WORD_REGEX = re.compile(r'\w+')
+# Words considered for transliteration; the range also takes in combining
+# marks and symbols such as ×, which \w excludes
 _WORD_BOUNDARY_REGEX = re.compile(r'[\w\u00C0-\u1EFF]+')
 
+# normalize() results are memoized for short inputs only: recurring phrases
+# in TTS/ASR serving are short, and long documents rarely repeat verbatim
+_NORMALIZE_CACHE_SIZE = 8192
+_NORMALIZE_CACHE_MAX_LENGTH = 256
+
+# Bump when the cached dictionary format changes
+_CSV_CACHE_VERSION = 2
+
 # Uppercase code pattern: 2+ chars, starts with uppercase letter, only uppercase + digits
 _UPPERCASE_CODE_PATTERN = re.compile(r'\b([A-Z][A-Z0-9]+)\b')
+# Parts of a code to spell out: digit groups and single letters
+_CODE_PART_PATTERN = re.compile(r'\d+|[A-Za-z]')
 
 LETTER_NAMES = {
     'A': 'a', 'B': 'bê', 'C': 'xê', 'D': 'đê', 'E': 'ê',
@@ -30,6 +50,109 @@ LETTER_NAMES = {
 }
 
 
+def _read_csv_pairs(f, key_columns, value_columns):
+    """
+    Yield (key, value) pairs from a CSV file with a header row.
+    
+    Column indices are resolved once from the header; for each row the first
+    non-empty value among `key_columns` (resp. `value_columns`) is used, in
+    order. Rows are read positionally with csv.reader, without building a
+    dict per row.
+    """
+    reader = csv.reader(f)
+    header = next(reader, [])
+    key_indices = [header.index(c) for c in key_columns if c in header]
+    value_indices = [header.index(c) for c in value_columns if c in header]
+    if not key_indices or not value_indices:
+        return
+    for row in reader:
+        n = len(row)
+        key = next((row[i] for i in key_indices if i < n and row[i]), '')
+        value = next((row[i] for i in value_indices if i < n and row[i]), '')
+        yield key, value
+
+
+def _parse_csv_map(path: Path, key_columns, value_columns, mapping: Dict[str, str]):
+    """Parse a CSV dictionary into `mapping` as {lowercased key: value}."""
+    with open(path, "r", encoding="utf-8") as f:
+        for key, value in _read_csv_pairs(f, key_columns, value_columns):
+            key = key.strip().lower()
+            value = value.strip()
+            if key and value:
+                # Many pronunciations repeat: share one str object per value
+                mapping[key] = sys.intern(value)
+
+
+def _load_csv_map(path: Path, key_columns, value_columns,
+                  cache_dir: Optional[Path] = None) -> Dict[str, str]:
+    """
+    Load a CSV dictionary, optionally through a JSON cache in `cache_dir`.
+    
+    The cache is keyed by the CSV's resolved path, mtime and size and by
+    the columns read, so editing the CSV invalidates it. It is only read if
+    the current user owns it and it is not group/world writable. Cache
+    read/write failures fall back to parsing the CSV.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+    
+    if cache_dir is not None:
+        resolved = str(path.resolve())
+        cache_key = [_CSV_CACHE_VERSION, resolved, stat.st_mtime_ns, stat.st_size,
+                     list(key_columns), list(value_columns)]
+        digest = hashlib.sha1(resolved.encode("utf-8")).hexdigest()[:16]
+        cache_path = Path(cache_dir) / f"{path.name}.{digest}.json"
+        mapping = _read_csv_cache(cache_path, cache_key)
+        if mapping is not None:
+            return mapping
+    
+    mapping = {}
+    try:
+        _parse_csv_map(path, key_columns, value_columns, mapping)
+    except Exception:
+        # Keep the rows read so far, but don't cache a partial load
+        return mapping
+    
+    if cache_dir is not None:
+        _write_csv_cache(cache_path, cache_key, mapping)
+    return mapping
+
+
+def _read_csv_cache(cache_path: Path, cache_key) -> Optional[Dict[str, str]]:
+    """Cached mapping for `cache_key`, or None if missing, stale or untrusted."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            st = os.fstat(f.fileno())
+            # Ignore a file another user could have written
+            if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+                return None
+            cached_key, mapping = json.load(f)
+    except Exception:
+        return None
+    if cached_key != cache_key or not isinstance(mapping, dict):
+        return None
+    # Share one str object per repeated value, as _parse_csv_map does
+    return {key: sys.intern(value) for key, value in mapping.items()}
+
+
+def _write_csv_cache(cache_path: Path, cache_key, mapping: Dict[str, str]):
+    """Write the cache atomically; failures (e.g. read-only dir) are ignored."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump([cache_key, mapping], f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        # Don't leave a partial temp file behind
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
 class VietnameseNormalizer:
     """
     Vietnamese text normalizer with dictionary support and transliteration.
@@ -53,7 +176,8 @@ class VietnameseNormalizer:
         acronyms_path: Optional[str] = None,
         non_vietnamese_words_path: Optional[str] = None,
         data_dir: Optional[str] = None,
-        enable_transliteration: bool = True
+        enable_transliteration: bool = True,
+        cache_dir: Optional[str] = None
     ):
         """
         Initialize the Vietnamese normalizer.
@@ -65,9 +189,13 @@ class VietnameseNormalizer:
                      'non-vietnamese-words.csv' in this directory.
             enable_transliteration: If True, words not in dictionary and not Vietnamese
                                   will be transliterated to Vietnamese phonetics.
+            cache_dir: Optional directory (e.g. under ~/.cache) where parsed CSV
+                      dictionaries are cached as JSON to speed up later starts.
+                      If None, nothing is written and the CSVs are parsed.
         """
         self.processor = VietnameseTextProcessor()
         self.enable_transliteration = enable_transliteration
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
         
         if data_dir:
             self.data_dir = Path(data_dir)
@@ -95,25 +223,14 @@ class VietnameseNormalizer:
                     acronyms_path = path
                     break
         
-        if acronyms_path and acronyms_path.exists():
-            try:
-                with open(acronyms_path, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        acronym = (
-                            row.get("acronym", "") or 
-                            row.get("word", "")
-                        ).strip().lower()
-                        transliteration = (
-                            row.get("transliteration", "") or 
-                            row.get("vietnamese_pronunciation", "")
-                        ).strip()
-                        if acronym and transliteration:
-                            acronym_map[acronym] = transliteration
-            except Exception:
-                pass
+        # _load_csv_map stats the file itself and returns {} if it is missing
+        if acronyms_path:
+            acronym_map = _load_csv_map(
+                acronyms_path, ("acronym", "word"), ("transliteration", "vietnamese_pronunciation"),
+                self.cache_dir
+            )
         
-        return dict(sorted(acronym_map.items(), key=lambda x: len(x[0]), reverse=True))
+        return acronym_map
     
     def _load_non_vietnamese_words(self, custom_path: Optional[str] = None) -> Dict[str, str]:
         """Load non-Vietnamese word mappings from CSV."""
@@ -132,125 +249,127 @@ class VietnameseNormalizer:
                     words_path = path
                     break
         
-        if words_path and words_path.exists():
-            try:
-                with open(words_path, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        word = (
-                            row.get("word", "") or 
-                            row.get("original", "")
-                        ).strip().lower()
-                        pronunciation = (
-                            row.get("vietnamese_pronunciation", "") or 
-                            row.get("transliteration", "")
-                        ).strip()
-                        if word and pronunciation:
-                            word_map[word] = pronunciation
-            except Exception:
-                pass
+        # _load_csv_map stats the file itself and returns {} if it is missing
+        if words_path:
+            word_map = _load_csv_map(
+                words_path, ("word", "original"), ("vietnamese_pronunciation", "transliteration"),
+                self.cache_dir
+            )
         
-        return dict(sorted(word_map.items(), key=lambda x: len(x[0]), reverse=True))
+        return word_map
     
     def _build_replacement_dict(self):
         """Build replacement dictionary from non-Vietnamese words only.
         Acronyms are handled separately by _handle_uppercase_codes (uppercase only)."""
-        self.replacements = {}
-        for word, pronunciation in self.non_vietnamese_map.items():
-            self.replacements[word.lower()] = pronunciation
+        words = self.non_vietnamese_map
+        if all(word == word.lower() for word in words):
+            # Loader keys are already lowercase: use the map itself rather
+            # than holding a second copy of it
+            self.replacements = words
+        else:
+            self.replacements = {word.lower(): pronunciation for word, pronunciation in words.items()}
+        
+        self._values_need_collapse = any(
+            value != ' '.join(value.split())
+            for mapping in (self.replacements, self.acronym_map)
+            for value in mapping.values()
+        )
+        
+        # Word pass of normalize(), specialized once per dictionary and indexed
+        # by whether transliteration is enabled; None when there is nothing to do
+        self._word_passes = (
+            partial(_DICTIONARY_WORD_REGEX.sub, self._replace_word) if self.replacements else None,
+            self._replace_or_transliterate,
+        )
+        
+        # Results depend on the dictionaries, so a rebuild starts a fresh cache
+        self._normalize_cached = lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)(self._normalize_uncached)
     
     def _spell_out_code(self, code: str) -> str:
         """Spell out an alphanumeric code letter by letter, digit groups as numbers.
         E.g. 'SE3' → 'ét ê ba', 'D19E' → 'đê mười chín ê'"""
-        parts = []
-        i = 0
-        while i < len(code):
-            if code[i].isdigit():
-                # Collect consecutive digits
-                j = i
-                while j < len(code) and code[j].isdigit():
-                    j += 1
-                parts.append(self.processor.number_to_words(code[i:j]))
-                i = j
-            elif code[i].upper() in LETTER_NAMES:
-                parts.append(LETTER_NAMES[code[i].upper()])
-                i += 1
-            else:
-                i += 1
-        return ' '.join(parts)
+        return ' '.join(
+            self.processor.number_to_words(part) if part[0].isdigit() else LETTER_NAMES[part.upper()]
+            for part in _CODE_PART_PATTERN.findall(code)
+        )
     
     def _handle_uppercase_codes(self, text: str) -> str:
         """Handle uppercase codes: check acronym dict first, else spell out letter by letter.
         Must be called BEFORE lowercasing."""
-        def replace_code(match):
-            code = match.group(1)
-            code_lower = code.lower()
-            # Check acronym dictionary first
-            if code_lower in self.acronym_map:
-                return self.acronym_map[code_lower]
-            # Not in acronym dict → spell out
-            return self._spell_out_code(code)
-        return _UPPERCASE_CODE_PATTERN.sub(replace_code, text)
+        return _UPPERCASE_CODE_PATTERN.sub(self._replace_code, text)
     
-    def _apply_transliteration(self, text: str) -> str:
+    def _replace_code(self, match) -> str:
+        code = match.group(1)
+        code_lower = code.lower()
+        # Check acronym dictionary first
+        if code_lower in self.acronym_map:
+            return self.acronym_map[code_lower]
+        # Not in acronym dict → spell out
+        return self._spell_out_code(code)
+    
+    def _transliterate_token(self, word: str) -> Optional[str]:
         """
-        Apply transliteration to words not in the replacement map.
-        Only processes words that weren't replaced by CSV and aren't Vietnamese.
-        Matches the logic from nghitts/src/utils/text-cleaner.js applyTransliteration().
+        Transliteration for a single lowercase word, or None if it should be
+        kept. Words in the CSV replacement map, Vietnamese words and single
+        characters are kept. Matches the filtering of
+        nghitts/src/utils/text-cleaner.js applyTransliteration().
         """
-        if not text:
-            return text
+        if len(word) <= 1:
+            return None
+        if word in self.replacements:
+            return None
+        if is_vietnamese_word(word):
+            return None
+        transliterated = transliterate_word(word)
+        if transliterated == word:
+            return None
+        return transliterated
+    
+    def _replace_word(self, match) -> str:
+        """CSV replacement for a word of the lowercased text."""
+        word = match[0]
+        return self.replacements.get(word, word)
+    
+    def _replace_or_transliterate(self, text: str) -> str:
+        """
+        CSV replacement for each word of the lowercased text, else its
+        transliteration, in one pass. Results are memoized for the call so
+        repeated words cost a single dict lookup.
+        """
+        replacements = self.replacements
+        transliterate_token = self._transliterate_token
+        dictionary_word = _DICTIONARY_WORD_REGEX.fullmatch
+        dictionary_words = _DICTIONARY_WORD_REGEX.findall
+        dictionary_sub = _DICTIONARY_WORD_REGEX.sub
+        seen: Dict[str, str] = {}
         
-        processed_words = set()
-        replacements_to_make = []
-
-        for match in _WORD_BOUNDARY_REGEX.finditer(text):
-            word = match.group(0)
-            word_lower = word.lower()
-            
-            if word_lower in processed_words:
-                continue
-            processed_words.add(word_lower)
-            
-            # Skip if word is in CSV replacement map
-            if word_lower in self.replacements:
-                continue
-            
-            # Skip if word is Vietnamese
-            if is_vietnamese_word(word) or is_vietnamese_word(word_lower):
-                continue
-            
-            # Skip single characters
-            if len(word) <= 1:
-                continue
-            
-            transliterated = transliterate_word(word)
-            if transliterated != word:
-                replacements_to_make.append((word, transliterated))
+        def replace_part(match) -> str:
+            part = match[0]
+            result = replacements.get(part)
+            if result is None:
+                transliterated = transliterate_token(part)
+                result = part if transliterated is None else transliterated
+            return result
         
-        # Apply replacements
-        for original, transliterated in replacements_to_make:
-            escaped = re.escape(original)
-            not_word_char = r'[^\w\u00C0-\u1EFF]'
-            pattern = re.compile(
-                rf'(?:^|({not_word_char}))({escaped})(?={not_word_char}|$)',
-                re.IGNORECASE
-            )
-            
-            def make_replacer(trans):
-                def replacer(m):
-                    boundary = m.group(1) or ''
-                    matched_word = m.group(2)
-                    if matched_word and matched_word[0].isupper():
-                        result = trans[0].upper() + trans[1:] if len(trans) > 1 else trans.upper()
-                    else:
-                        result = trans
-                    return boundary + result
-                return replacer
-            
-            text = pattern.sub(make_replacer(transliterated), text)
+        def replace(match) -> str:
+            word = match[0]
+            result = seen.get(word)
+            if result is None:
+                result = replacements.get(word)
+                if result is None and not dictionary_word(word):
+                    # The word spans several dictionary words (e.g. around a
+                    # combining mark or ×): if any of them is in the map,
+                    # replace or transliterate each one on its own
+                    parts = dictionary_words(word)
+                    if any(part in replacements for part in parts):
+                        result = dictionary_sub(replace_part, word)
+                if result is None:
+                    transliterated = transliterate_token(word)
+                    result = word if transliterated is None else transliterated
+                seen[word] = result
+            return result
         
-        return text
+        return _WORD_BOUNDARY_REGEX.sub(replace, text)
     
     def normalize(
         self,
@@ -277,17 +396,25 @@ class VietnameseNormalizer:
             
         Returns:
             Normalized text string.
+        
+        Results for short inputs are cached per normalizer; the cache is reset
+        by reload_dictionaries().
         """
         if not text:
             return ''
         
+        should_transliterate = enable_transliteration if enable_transliteration is not None else self.enable_transliteration
+        if len(text) <= _NORMALIZE_CACHE_MAX_LENGTH:
+            return self._normalize_cached(text, bool(enable_preprocessing), bool(should_transliterate))
+        return self._normalize_uncached(text, enable_preprocessing, should_transliterate)
+    
+    def _normalize_uncached(self, text: str, enable_preprocessing: bool, should_transliterate: bool) -> str:
+        """Run the normalize() pipeline (uncached) with resolved options."""
         if enable_preprocessing:
             # Step 1: Process Vietnamese text (numbers, dates, times, etc.)
             normalized = self.processor.process_vietnamese_text(text)
         else:
-            import unicodedata
             normalized = unicodedata.normalize('NFC', text)
-            normalized = re.sub(r'\s+', ' ', normalized).strip()
         
         # Step 2: Handle uppercase codes (acronyms/abbreviations)
         # Must run BEFORE lowercasing to detect uppercase
@@ -296,27 +423,43 @@ class VietnameseNormalizer:
         # Step 3: Lowercase normalization for consistent matching
         normalized = normalized.lower()
         
-        # Step 3 & 4: Replace words/acronyms using fast word-by-word lookup
-        if self.replacements:
-            def replace_word(match):
-                word = match.group(0)
-                word_lower = word.lower()
-                if word_lower in self.replacements:
-                    return self.replacements[word_lower]
-                return word
-            
-            normalized = re.sub(r'\b\w+\b', replace_word, normalized)
-        
-        # Step 5: Transliterate remaining non-Vietnamese words
-        should_transliterate = enable_transliteration if enable_transliteration is not None else self.enable_transliteration
-        if should_transliterate:
-            normalized = self._apply_transliteration(normalized)
+        # Step 3 & 4: Replace words from CSV and, in the same pass,
+        # Step 5: transliterate remaining non-Vietnamese words
+        word_pass = self._word_passes[bool(should_transliterate)]
+        if word_pass is not None:
+            normalized = word_pass(normalized)
         
-        # Clean up whitespace
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        # Clean up whitespace. Processor output is already collapsed, and the
+        # substitutions above only insert single-spaced text unless a
+        # dictionary value itself has irregular whitespace
+        if not enable_preprocessing or self._values_need_collapse:
+            normalized = ' '.join(normalized.split())
         
         return normalized
     
+    def normalize_many(
+        self,
+        texts: Iterable[str],
+        enable_preprocessing: bool = True,
+        enable_transliteration: Optional[bool] = None
+    ) -> List[str]:
+        """
+        Normalize a batch of texts.
+        
+        Equivalent to calling normalize() on each text, with the same
+        options, but binds the normalizer once for the whole batch.
+        
+        Args:
+            texts: Texts to normalize.
+            enable_preprocessing: See normalize().
+            enable_transliteration: See normalize().
+            
+        Returns:
+            List of normalized strings, in input order.
+        """
+        normalize = self.normalize
+        return [normalize(text, enable_preprocessing, enable_transliteration) for text in texts]
+    
     def reload_dictionaries(
         self,
         acronyms_path: Optional[str] = None,
@@ -6,6 +6,8 @@ Converts English words to Vietnamese phonetic transliteration using rule-based a
 """
 
 import re
+from functools import lru_cache
+
 from .detector import is_vietnamese_word
 
 
@@ -298,13 +300,83 @@ _VALID_CONSONANT_PAIRS = {'ch', 'th', 'ph', 'sh', 'ng', 'tr', 'nh', 'gh', 'kh'}
 _CONSONANTS = set('bcdfghjklmnpqrstvwxz')
 _VALID_ENDINGS = {'p', 't', 'c', 'm', 'n', 'g', 's'}
 
+# Every ending rule is a literal suffix ('ook$', ...), so ENDING_RULES are
+# indexed by the suffix's last character: (rule index, suffix, replacement)
+_ENDING_RULES_BY_LAST_CHAR = {}
+for _index, (_pattern, _replacement) in enumerate(ENDING_RULES):
+    _suffix = _pattern.pattern[:-1]
+    _ENDING_RULES_BY_LAST_CHAR.setdefault(_suffix[-1], []).append((_index, _suffix, _replacement))
+del _index, _pattern, _replacement, _suffix
 
-def _apply_rules(w, rules):
+
+_RULE_ASSERTION_PATTERN = re.compile(r'\\b|\$|\(\?<?[=!][^)]*\)')
+
+
+def _prefilter_rules(rules):
+    """
+    Pair each rule with the literals it needs: (literals, pattern, replacement).
+
+    A rule can only match if one of its literals occurs in the word, so it is
+    skipped otherwise. Plain literal rules get pattern None and run as
+    str.replace; rules that rewrite a literal to itself are dropped.
+    """
+    prepared = []
     for pattern, replacement in rules:
+        literals = tuple(
+            _RULE_ASSERTION_PATTERN.sub('', alternative)
+            for alternative in pattern.pattern.split('|')
+        )
+        if not all(literal.isalpha() for literal in literals):
+            prepared.append((None, pattern, replacement))
+        elif literals == (replacement,):
+            continue
+        elif literals[0] == pattern.pattern:
+            prepared.append((literals, None, replacement))
+        else:
+            prepared.append((literals, pattern, replacement))
+    return tuple(prepared)
+
+
+_HIGH_PRIORITY_RULES_PREPARED = _prefilter_rules(HIGH_PRIORITY_RULES)
+_GENERAL_RULES_PREPARED = _prefilter_rules(GENERAL_RULES)
+# Most words contain none of the high-priority literals; one search rules
+# them all out before _apply_rules() tests them one at a time
+_HIGH_PRIORITY_LITERALS_PATTERN = re.compile('|'.join(
+    literal for literals, _, _ in _HIGH_PRIORITY_RULES_PREPARED for literal in literals
+))
+
+
+def _apply_rules(w, rules):
+    """Apply rules prepared by _prefilter_rules() in order."""
+    for literals, pattern, replacement in rules:
+        if literals is not None:
+            for literal in literals:
+                if literal in w:
+                    break
+            else:
+                continue
+            if pattern is None:
+                w = w.replace(literal, replacement)
+                continue
         w = pattern.sub(replacement, w)
     return w
 
 
+def _apply_ending_rules(w):
+    """Apply ENDING_RULES in order, each to the previous rules' output,
+    testing only the rules whose suffix ends with the word's last character."""
+    start = 0
+    while w:
+        for index, suffix, replacement in _ENDING_RULES_BY_LAST_CHAR.get(w[-1], ()):
+            if index >= start and w.endswith(suffix):
+                w = w[:-len(suffix)] + replacement
+                start = index + 1
+                break
+        else:
+            break
+    return w
+
+
 def _clean_consonant_clusters(p):
     """Remove invalid consonant clusters, keeping only valid Vietnamese pairs."""
     p = _DOUBLE_CONSONANT_PATTERN.sub(r'\1', p)
@@ -359,9 +431,10 @@ def _process_syllable(s):
     if s.startswith('y'):
         s = 'd' + s[1:]
 
-    s = _apply_rules(s, HIGH_PRIORITY_RULES)
-    s = _apply_rules(s, ENDING_RULES)
-    s = _apply_rules(s, GENERAL_RULES)
+    if _HIGH_PRIORITY_LITERALS_PATTERN.search(s):
+        s = _apply_rules(s, _HIGH_PRIORITY_RULES_PREPARED)
+    s = _apply_ending_rules(s)
+    s = _apply_rules(s, _GENERAL_RULES_PREPARED)
 
     s = _CONSONANT_Y_PATTERN.sub(r'\1i', s)
     s = _Y_END_PATTERN.sub('i', s)
@@ -385,9 +458,10 @@ def english_to_vietnamese(word: str) -> str:
     if w.startswith('d'):
         w = 'đ' + w[1:]
 
-    w = _apply_rules(w, HIGH_PRIORITY_RULES)
-    w = _apply_rules(w, ENDING_RULES)
-    w = _apply_rules(w, GENERAL_RULES)
+    if _HIGH_PRIORITY_LITERALS_PATTERN.search(w):
+        w = _apply_rules(w, _HIGH_PRIORITY_RULES_PREPARED)
+    w = _apply_ending_rules(w)
+    w = _apply_rules(w, _GENERAL_RULES_PREPARED)
 
     w = _CONSONANT_Y_PATTERN.sub(r'\1i', w)
     w = _Y_END_PATTERN.sub('i', w)
@@ -410,6 +484,12 @@ def transliterate_word(word: str) -> str:
     if not word or not isinstance(word, str):
         return word or ''
 
+    return _transliterate_cached(word)
+
+
+@lru_cache(maxsize=131072)
+def _transliterate_cached(word: str) -> str:
+    """transliterate_word for non-empty strings; the rules are fixed, so results are cached."""
     if is_vietnamese_word(word):
         return word
 